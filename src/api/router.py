@@ -4,27 +4,7 @@ from .v1 import users, certificates, data_packages, auth
 # Create the main API router
 api_router = APIRouter()
 
-# Include all route modules
-api_router.include_router(
-    auth.router,
-    prefix="/auth",
-    tags=["Authentication"]
-)
-
-api_router.include_router(
-    users.router,
-    prefix="/users",
-    tags=["Users"]
-)
-
-api_router.include_router(
-    certificates.router,
-    prefix="/certificates",
-    tags=["Certificates"]
-)
-
-api_router.include_router(
-    data_packages.router,
-    prefix="/data-packages",
-    tags=["Data Packages"]
-)
+# Each route module's router carries its own prefix and tags, so the
+# finished routes can be merged directly instead of re-built per include
+for module_router in (auth.router, users.router, certificates.router, data_packages.router):
+    api_router.routes.extend(module_router.routes)
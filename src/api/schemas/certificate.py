@@ -1,11 +1,12 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, constr
+from typing import List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, StringConstraints, TypeAdapter
+from typing_extensions import Annotated
 
 class CertificateBase(BaseModel):
     """Base certificate schema."""
-    name: constr(min_length=1, max_length=255)
-    cert_type: constr(regex='^(client|server|ca)$')
+    name: Annotated[str, StringConstraints(min_length=1, max_length=255)]
+    cert_type: Literal['client', 'server', 'ca']
 
 class CertificateCreate(CertificateBase):
     """Schema for certificate creation."""
@@ -18,6 +19,8 @@ class CertificateUpdate(BaseModel):
 
 class CertificateResponse(CertificateBase):
     """Schema for certificate responses."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     file_path: str
     expiration_date: datetime
@@ -27,15 +30,11 @@ class CertificateResponse(CertificateBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        """Pydantic config for ORM mode."""
-        from_attributes = True
-
 class CertificateWithUser(CertificateResponse):
     """Schema for certificate with user details."""
+    model_config = ConfigDict(from_attributes=True)
+
     user_username: str
     user_email: str
 
-    class Config:
-        """Pydantic config for ORM mode."""
-        from_attributes = True
+certificate_list_adapter = TypeAdapter(List[CertificateWithUser])
@@ -1,60 +1,53 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, constr, validator
+from typing import List, Literal, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, StringConstraints, TypeAdapter
+from typing_extensions import Annotated
+
+def _number_to_str(value):
+    """Accept numeric manifest values such as {"version": 2} as their text form."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+ManifestStr = Annotated[str, BeforeValidator(_number_to_str)]
+
+class ServerConfig(BaseModel):
+    """Server connection settings written into the package preferences; extra keys are kept."""
+    model_config = ConfigDict(extra='allow')
+
+    hostname: str
+    port: int
+    protocol: Literal['ssl', 'tcp', 'quic']
+
+class ManifestConfig(BaseModel):
+    """Manifest settings; extra keys fill matching manifest placeholders."""
+    model_config = ConfigDict(extra='allow')
+
+    uid: ManifestStr
+    version: ManifestStr
+    name: ManifestStr
 
 class DataPackageBase(BaseModel):
     """Base data package schema."""
-    name: constr(min_length=1, max_length=255)
-    package_type: constr(regex='^(full|basic|itak)$')
-    server_config: dict
-    manifest_config: dict
+    name: Annotated[str, StringConstraints(min_length=1, max_length=255)]
+    package_type: Literal['full', 'basic', 'itak']
+    server_config: ServerConfig
+    manifest_config: ManifestConfig
 
 class DataPackageCreate(DataPackageBase):
     """Schema for data package creation."""
     certificate_id: int
 
-    @validator('server_config')
-    def validate_server_config(cls, v):
-        """Validate server configuration."""
-        required_fields = ['hostname', 'port', 'protocol']
-        if not all(field in v for field in required_fields):
-            raise ValueError(f"Server config must contain: {', '.join(required_fields)}")
-        return v
-
-    @validator('manifest_config')
-    def validate_manifest_config(cls, v):
-        """Validate manifest configuration."""
-        required_fields = ['uid', 'version', 'name']
-        if not all(field in v for field in required_fields):
-            raise ValueError(f"Manifest config must contain: {', '.join(required_fields)}")
-        return v
-
 class DataPackageUpdate(BaseModel):
     """Schema for data package updates."""
     is_active: Optional[bool] = None
-    server_config: Optional[dict] = None
-    manifest_config: Optional[dict] = None
-
-    @validator('server_config')
-    def validate_server_config(cls, v):
-        """Validate server configuration."""
-        if v is not None:
-            required_fields = ['hostname', 'port', 'protocol']
-            if not all(field in v for field in required_fields):
-                raise ValueError(f"Server config must contain: {', '.join(required_fields)}")
-        return v
-
-    @validator('manifest_config')
-    def validate_manifest_config(cls, v):
-        """Validate manifest configuration."""
-        if v is not None:
-            required_fields = ['uid', 'version', 'name']
-            if not all(field in v for field in required_fields):
-                raise ValueError(f"Manifest config must contain: {', '.join(required_fields)}")
-        return v
+    server_config: Optional[ServerConfig] = None
+    manifest_config: Optional[ManifestConfig] = None
 
 class DataPackageResponse(DataPackageBase):
     """Schema for data package responses."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     file_path: str
     is_active: bool
@@ -63,16 +56,12 @@ class DataPackageResponse(DataPackageBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        """Pydantic config for ORM mode."""
-        from_attributes = True
-
 class DataPackageWithRelations(DataPackageResponse):
     """Schema for data package with related data."""
+    model_config = ConfigDict(from_attributes=True)
+
     user_username: str
     certificate_name: str
     certificate_type: str
 
-    class Config:
-        """Pydantic config for ORM mode."""
-        from_attributes = True
+data_package_list_adapter = TypeAdapter(List[DataPackageWithRelations])
@@ -0,0 +1,15 @@
+from typing import Any, Type, TypeVar
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def construct_from_orm(model: Type[ModelT], obj: Any, **overrides: Any) -> ModelT:
+    """
+    Build a response schema from an ORM object without validation.
+
+    Rows come straight from the database, so re-validating them on list
+    endpoints is wasted work. Fields given in overrides replace the
+    attribute read from obj.
+    """
+    fields = {field: getattr(obj, field) for field in model.model_fields if field not in overrides}
+    return model.model_construct(**fields, **overrides)
@@ -1,36 +1,35 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr, constr
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints, TypeAdapter
+from typing_extensions import Annotated
 
 class UserBase(BaseModel):
     """Base user schema with common attributes."""
-    username: constr(min_length=3, max_length=50)
+    username: Annotated[str, StringConstraints(min_length=3, max_length=50)]
     email: EmailStr
 
 class UserCreate(UserBase):
     """Schema for user creation requests."""
-    password: constr(min_length=8)
+    password: Annotated[str, StringConstraints(min_length=8)]
 
 class UserUpdate(BaseModel):
     """Schema for user update requests."""
     email: Optional[EmailStr] = None
-    password: Optional[constr(min_length=8)] = None
+    password: Optional[Annotated[str, StringConstraints(min_length=8)]] = None
     is_active: Optional[bool] = None
 
 class UserResponse(UserBase):
     """Schema for user responses."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     is_active: bool
     created_at: datetime
-    
-    class Config:
-        """Pydantic config for ORM mode."""
-        from_attributes = True
 
 class UserInDB(UserResponse):
     """Schema for user in database (includes hashed password)."""
+    model_config = ConfigDict(from_attributes=True)
+
     hashed_password: str
 
-    class Config:
-        """Pydantic config for ORM mode."""
-        from_attributes = True
+user_list_adapter = TypeAdapter(List[UserResponse])
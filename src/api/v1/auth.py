@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import NamedTuple, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
@@ -8,12 +9,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from ...db.session import get_db
+from ...db.cache import fetch_user, fetch_user_flags
 from ...db.models import User
 from ...config.settings import get_settings
 from ..schemas.auth import Token, TokenData
 from ..schemas.user import UserCreate, UserResponse
 
-router = APIRouter()
+router = APIRouter(prefix="/auth", tags=["Authentication"])
 settings = get_settings()
 
 # Security utilities
@@ -36,7 +38,10 @@ async def get_user(db: AsyncSession, username: str) -> Optional[User]:
 async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
     """Authenticate user with username and password."""
     user = await get_user(db, username)
-    if not user or not verify_password(password, user.hashed_password):
+    if not user:
+        return None
+    # bcrypt is deliberately slow; keep it off the event loop
+    if not await asyncio.to_thread(verify_password, password, user.hashed_password):
         return None
     return user
 
@@ -47,16 +52,22 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
+def credentials_exception() -> HTTPException:
+    """Build the 401 raised for a missing, invalid or unknown token."""
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+class CurrentUserLite(NamedTuple):
+    """Identity and permission flags of the authenticated user."""
+    id: int
+    is_superuser: bool
+    is_active: bool
+
+def get_token_username(token: str) -> str:
+    """Extract the username from a JWT token, raising 401 if it is invalid."""
     try:
         payload = jwt.decode(
             token,
@@ -65,14 +76,20 @@ async def get_current_user(
         )
         username: str = payload.get("sub")
         if username is None:
-            raise credentials_exception
+            raise credentials_exception()
         token_data = TokenData(username=username)
     except JWTError:
-        raise credentials_exception
-    
-    user = await get_user(db, username=token_data.username)
+        raise credentials_exception()
+    return token_data.username
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get current authenticated user from JWT token."""
+    user = await fetch_user(db, username=get_token_username(token))
     if user is None:
-        raise credentials_exception
+        raise credentials_exception()
     return user
 
 async def get_current_active_user(
@@ -83,6 +100,24 @@ async def get_current_active_user(
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+async def get_current_active_user_lite(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> CurrentUserLite:
+    """
+    Get the current active user's id and permission flags without loading the full User.
+
+    For routes that only make permission decisions on `id` and `is_superuser`.
+    """
+    flags = await fetch_user_flags(db, get_token_username(token))
+    if flags is None:
+        raise credentials_exception()
+    current_user = CurrentUserLite(*flags)
+
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
@@ -118,7 +153,7 @@ async def register_user(
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     db_user = User(
         username=user_data.username,
         email=user_data.email,
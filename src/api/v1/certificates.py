@@ -1,25 +1,31 @@
-import os
 from datetime import datetime, timedelta
 from typing import List
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 from sqlalchemy import update
 
 from ...db.session import get_db
 from ...db.models import Certificate, User
+from ..schemas.orm import construct_from_orm
 from ..schemas.certificate import (
     CertificateCreate,
     CertificateUpdate,
     CertificateResponse,
-    CertificateWithUser
+    CertificateWithUser,
+    certificate_list_adapter
+)
+from .auth import (
+    CurrentUserLite,
+    get_current_active_user,
+    get_current_active_user_lite
 )
-from .auth import get_current_active_user
-from ...config.settings import get_settings
 from ...utils.certificate import generate_certificate, revoke_certificate
 
-router = APIRouter()
-settings = get_settings()
+router = APIRouter(prefix="/certificates", tags=["Certificates"])
 
 @router.post("/", response_model=CertificateResponse)
 async def create_certificate(
@@ -60,11 +66,11 @@ async def create_certificate(
 async def list_certificates(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """List certificates (filtered by user unless superuser)."""
-    query = select(Certificate).join(User)
+    query = select(Certificate).options(selectinload(Certificate.user))
     
     if not current_user.is_superuser:
         query = query.filter(Certificate.user_id == current_user.id)
@@ -72,19 +78,23 @@ async def list_certificates(
     result = await db.execute(
         query.offset(skip).limit(limit)
     )
-    certificates = result.scalars().all()
-    return certificates
+    certificates = [
+        construct_from_orm(CertificateWithUser, cert) for cert in result.scalars()
+    ]
+    return ORJSONResponse(
+        content=certificate_list_adapter.dump_python(certificates, mode="json")
+    )
 
 @router.get("/{cert_id}", response_model=CertificateWithUser)
 async def get_certificate(
     cert_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Get certificate by ID."""
     result = await db.execute(
         select(Certificate)
-        .join(User)
+        .options(selectinload(Certificate.user))
         .filter(Certificate.id == cert_id)
     )
     certificate = result.scalar_one_or_none()
@@ -107,7 +117,7 @@ async def get_certificate(
 async def update_certificate(
     cert_id: int,
     cert_update: CertificateUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Update certificate (mainly for revocation)."""
@@ -141,33 +151,33 @@ async def update_certificate(
             )
 
     # Update certificate
-    update_data = cert_update.dict(exclude_unset=True)
-    await db.execute(
+    update_data = cert_update.model_dump(exclude_unset=True)
+    # Expire the loaded row so RETURNING refreshes it, including server-side updated_at
+    db.expire(certificate)
+    result = await db.execute(
         update(Certificate)
         .where(Certificate.id == cert_id)
         .values(**update_data)
+        .returning(Certificate)
     )
+    updated_cert = result.scalar_one()
     await db.commit()
 
-    # Get updated certificate
-    result = await db.execute(
-        select(Certificate).filter(Certificate.id == cert_id)
-    )
-    updated_cert = result.scalar_one()
     return updated_cert
 
 @router.get("/{cert_id}/download")
 async def download_certificate(
     cert_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Download certificate files."""
-    # Get certificate
+    # Fetch only the columns needed for the permission checks
     result = await db.execute(
-        select(Certificate).filter(Certificate.id == cert_id)
+        select(Certificate.user_id, Certificate.is_revoked, Certificate.file_path)
+        .filter(Certificate.id == cert_id)
     )
-    certificate = result.scalar_one_or_none()
+    certificate = result.first()
 
     if certificate is None:
         raise HTTPException(
@@ -188,7 +198,7 @@ async def download_certificate(
         )
 
     # Check if certificate file exists
-    if not os.path.exists(certificate.file_path):
+    if not await anyio.Path(certificate.file_path).exists():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Certificate file not found"
@@ -199,15 +209,16 @@ async def download_certificate(
 @router.post("/{cert_id}/revoke", response_model=CertificateResponse)
 async def revoke_cert(
     cert_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Revoke a certificate."""
-    # Get certificate
+    # Fetch only the columns needed for the permission checks
     result = await db.execute(
-        select(Certificate).filter(Certificate.id == cert_id)
+        select(Certificate.user_id, Certificate.is_revoked, Certificate.file_path)
+        .filter(Certificate.id == cert_id)
     )
-    certificate = result.scalar_one_or_none()
+    certificate = result.first()
 
     if certificate is None:
         raise HTTPException(
@@ -237,19 +248,16 @@ async def revoke_cert(
         )
 
     # Update certificate status
-    await db.execute(
+    result = await db.execute(
         update(Certificate)
         .where(Certificate.id == cert_id)
         .values(
             is_revoked=True,
             revocation_date=datetime.utcnow()
         )
+        .returning(Certificate)
     )
+    updated_cert = result.scalar_one()
     await db.commit()
 
-    # Get updated certificate
-    result = await db.execute(
-        select(Certificate).filter(Certificate.id == cert_id)
-    )
-    updated_cert = result.scalar_one()
     return updated_cert
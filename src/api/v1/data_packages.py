@@ -1,21 +1,31 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import lazyload, selectinload
 from sqlalchemy import update
 
 from ...db.session import get_db
 from ...db.models import DataPackage, User, Certificate
+from ..schemas.orm import construct_from_orm
 from ..schemas.data_package import (
     DataPackageCreate,
     DataPackageUpdate,
     DataPackageResponse,
-    DataPackageWithRelations
+    DataPackageWithRelations,
+    ManifestConfig,
+    ServerConfig,
+    data_package_list_adapter
+)
+from .auth import (
+    CurrentUserLite,
+    get_current_active_user,
+    get_current_active_user_lite
 )
-from .auth import get_current_active_user
 from ...utils.data_package import create_data_package_files, update_data_package_files
 
-router = APIRouter()
+router = APIRouter(prefix="/data-packages", tags=["Data Packages"])
 
 @router.post("/", response_model=DataPackageResponse)
 async def create_data_package(
@@ -26,10 +36,15 @@ async def create_data_package(
     """Create a new data package."""
     # Verify certificate exists and belongs to user
     result = await db.execute(
-        select(Certificate)
+        select(
+            Certificate.id,
+            Certificate.user_id,
+            Certificate.is_revoked,
+            Certificate.file_path
+        )
         .filter(Certificate.id == package_data.certificate_id)
     )
-    certificate = result.scalar_one_or_none()
+    certificate = result.first()
 
     if not certificate:
         raise HTTPException(
@@ -49,12 +64,15 @@ async def create_data_package(
             detail="Cannot use revoked certificate"
         )
 
+    server_config = package_data.server_config.model_dump()
+    manifest_config = package_data.manifest_config.model_dump()
+
     try:
         # Generate data package files
         file_path = await create_data_package_files(
             package_type=package_data.package_type,
-            server_config=package_data.server_config,
-            manifest_config=package_data.manifest_config,
+            server_config=server_config,
+            manifest_config=manifest_config,
             certificate=certificate,
             user=current_user
         )
@@ -64,15 +82,16 @@ async def create_data_package(
             name=package_data.name,
             package_type=package_data.package_type,
             file_path=file_path,
-            server_config=package_data.server_config,
-            manifest_config=package_data.manifest_config,
+            server_config=server_config,
+            manifest_config=manifest_config,
             user_id=current_user.id,
             certificate_id=certificate.id
         )
 
         db.add(db_package)
         await db.commit()
-        await db.refresh(db_package)
+        # Only the server-generated columns; the response does not use the relations
+        await db.refresh(db_package, attribute_names=["created_at", "updated_at"])
 
         return db_package
 
@@ -86,11 +105,14 @@ async def create_data_package(
 async def list_data_packages(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """List data packages (filtered by user unless superuser)."""
-    query = select(DataPackage).join(User).join(Certificate)
+    query = select(DataPackage).options(
+        selectinload(DataPackage.user),
+        selectinload(DataPackage.certificate)
+    )
     
     if not current_user.is_superuser:
         query = query.filter(DataPackage.user_id == current_user.id)
@@ -98,20 +120,32 @@ async def list_data_packages(
     result = await db.execute(
         query.offset(skip).limit(limit)
     )
-    packages = result.scalars().all()
-    return packages
+    packages = [
+        construct_from_orm(
+            DataPackageWithRelations,
+            package,
+            server_config=ServerConfig.model_construct(**package.server_config),
+            manifest_config=ManifestConfig.model_construct(**package.manifest_config)
+        )
+        for package in result.scalars()
+    ]
+    return ORJSONResponse(
+        content=data_package_list_adapter.dump_python(packages, mode="json")
+    )
 
 @router.get("/{package_id}", response_model=DataPackageWithRelations)
 async def get_data_package(
     package_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Get data package by ID."""
     result = await db.execute(
         select(DataPackage)
-        .join(User)
-        .join(Certificate)
+        .options(
+            selectinload(DataPackage.user),
+            selectinload(DataPackage.certificate)
+        )
         .filter(DataPackage.id == package_id)
     )
     package = result.scalar_one_or_none()
@@ -134,13 +168,14 @@ async def get_data_package(
 async def update_data_package(
     package_id: int,
     package_update: DataPackageUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Update data package."""
-    # Get existing package
+    # Get existing package; repackaging needs the certificate but not the user
     result = await db.execute(
         select(DataPackage)
+        .options(lazyload("*"), selectinload(DataPackage.certificate))
         .filter(DataPackage.id == package_id)
     )
     package = result.scalar_one_or_none()
@@ -162,24 +197,30 @@ async def update_data_package(
         if package_update.server_config or package_update.manifest_config:
             await update_data_package_files(
                 package=package,
-                server_config=package_update.server_config or package.server_config,
-                manifest_config=package_update.manifest_config or package.manifest_config
+                server_config=(
+                    package_update.server_config.model_dump()
+                    if package_update.server_config else package.server_config
+                ),
+                manifest_config=(
+                    package_update.manifest_config.model_dump()
+                    if package_update.manifest_config else package.manifest_config
+                )
             )
 
         # Update database record
-        update_data = package_update.dict(exclude_unset=True)
-        await db.execute(
+        update_data = package_update.model_dump(exclude_unset=True)
+        # Expire the loaded row so RETURNING refreshes it, including server-side updated_at
+        db.expire(package)
+        result = await db.execute(
             update(DataPackage)
             .where(DataPackage.id == package_id)
             .values(**update_data)
+            .returning(DataPackage)
+            .options(lazyload("*"))
         )
+        updated_package = result.scalar_one()
         await db.commit()
 
-        # Get updated package
-        result = await db.execute(
-            select(DataPackage).filter(DataPackage.id == package_id)
-        )
-        updated_package = result.scalar_one()
         return updated_package
 
     except Exception as e:
@@ -191,15 +232,22 @@ async def update_data_package(
 @router.get("/{package_id}/download")
 async def download_data_package(
     package_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Download data package files."""
+    # Fetch the package and its certificate's revocation state in one query
     result = await db.execute(
-        select(DataPackage)
+        select(
+            DataPackage.user_id,
+            DataPackage.is_active,
+            DataPackage.file_path,
+            Certificate.is_revoked.label("certificate_revoked")
+        )
+        .join(Certificate, DataPackage.certificate_id == Certificate.id)
         .filter(DataPackage.id == package_id)
     )
-    package = result.scalar_one_or_none()
+    package = result.first()
 
     if not package:
         raise HTTPException(
@@ -220,13 +268,7 @@ async def download_data_package(
         )
 
     # Verify certificate is still valid
-    result = await db.execute(
-        select(Certificate)
-        .filter(Certificate.id == package.certificate_id)
-    )
-    certificate = result.scalar_one()
-
-    if certificate.is_revoked:
+    if package.certificate_revoked:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Associated certificate is revoked"
@@ -1,21 +1,25 @@
+import asyncio
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import update, delete
 
 from ...db.session import get_db
 from ...db.models import User
-from ..schemas.user import UserCreate, UserUpdate, UserResponse
-from .auth import get_current_active_user, get_password_hash
+from ...db.cache import invalidate_user
+from ..schemas.orm import construct_from_orm
+from ..schemas.user import UserCreate, UserUpdate, UserResponse, user_list_adapter
+from .auth import CurrentUserLite, get_current_active_user_lite, get_password_hash
 
-router = APIRouter()
+router = APIRouter(prefix="/users", tags=["Users"])
 
 @router.get("/", response_model=List[UserResponse])
 async def list_users(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """List all users (requires authentication)."""
@@ -30,13 +34,13 @@ async def list_users(
         .offset(skip)
         .limit(limit)
     )
-    users = result.scalars().all()
-    return users
+    users = [construct_from_orm(UserResponse, user) for user in result.scalars()]
+    return ORJSONResponse(content=user_list_adapter.dump_python(users, mode="json"))
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Get user by ID (requires authentication)."""
@@ -61,7 +65,7 @@ async def get_user(
 async def update_user(
     user_id: int,
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Update user (requires authentication)."""
@@ -71,38 +75,37 @@ async def update_user(
             detail="Not enough permissions"
         )
     
-    # Check if user exists
-    result = await db.execute(select(User).filter(User.id == user_id))
-    user = result.scalar_one_or_none()
-    
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
     # Prepare update data
-    update_data = user_update.dict(exclude_unset=True)
+    update_data = user_update.model_dump(exclude_unset=True)
     if "password" in update_data:
-        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+        update_data["hashed_password"] = await asyncio.to_thread(
+            get_password_hash, update_data.pop("password")
+        )
     
-    # Update user
-    await db.execute(
+    # Update user; no returned row means the user does not exist
+    result = await db.execute(
         update(User)
         .where(User.id == user_id)
         .values(**update_data)
+        .returning(User)
     )
+    updated_user = result.scalar_one_or_none()
+    
+    if updated_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
     await db.commit()
+    invalidate_user(updated_user.username)
     
-    # Get updated user
-    result = await db.execute(select(User).filter(User.id == user_id))
-    updated_user = result.scalar_one()
     return updated_user
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete user (requires superuser permissions)."""
@@ -125,11 +128,12 @@ async def delete_user(
     # Delete user
     await db.execute(delete(User).where(User.id == user_id))
     await db.commit()
+    invalidate_user(user.username)
 
 @router.post("/superuser", response_model=UserResponse)
 async def create_superuser(
     user_data: UserCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUserLite = Depends(get_current_active_user_lite),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a superuser (requires superuser permissions)."""
@@ -148,7 +152,7 @@ async def create_superuser(
         )
     
     # Create superuser
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     db_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -1,6 +1,6 @@
 from typing import Optional
 from pydantic_settings import BaseSettings
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 
 class Settings(BaseSettings):
@@ -16,16 +16,24 @@ class Settings(BaseSettings):
     # Database Settings
     DATABASE_URL: str
     ASYNC_DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
     
     # Redis Settings (Optional)
     REDIS_URL: Optional[str] = None
     REDIS_ENABLED: bool = False
     
+    # Cache Settings
+    USER_CACHE_TTL: int = 30  # seconds an authenticated user lookup stays cached
+    
     # ATAK Server Settings
     ATAK_SERVER_HOST: str
     ATAK_SERVER_PORT: int = 8089
     ATAK_CERT_DIR: str = "/opt/tak/certs"
     ATAK_FILES_DIR: str = "/opt/tak/certs/files"
+    ATAK_CERT_PASSWORD: str = "atakatak"
     
     # JWT Settings
     JWT_SECRET_KEY: str
@@ -45,17 +53,17 @@ class Settings(BaseSettings):
             return f"{self.DATABASE_URL}_test"
         return self.DATABASE_URL
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if the application is running in development mode."""
         return self.APP_ENV.lower() == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if the application is running in production mode."""
         return self.APP_ENV.lower() == "production"
 
-    @property
+    @cached_property
     def is_test(self) -> bool:
         """Check if the application is running in test mode."""
         return self.APP_ENV.lower() == "test"
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import AuditLog
+from .session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Flush when this many entries are pending or this many seconds have passed
+_BATCH_SIZE = 100
+_BATCH_WINDOW = 0.5
+
+# Created by start_audit_writer so it binds to the running loop; None is
+# the stop sentinel put by stop_audit_writer
+_audit_queue: Optional["asyncio.Queue[Optional[Dict[str, Any]]]"] = None
+_writer_task: Optional[asyncio.Task] = None
+
+# Entries queued while no writer is running, handed over on the next start
+_pending: List[Dict[str, Any]] = []
+
+def _entry(
+    action: str,
+    entity_type: str,
+    entity_id: int,
+    user_id: Optional[int],
+    details: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return {
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "user_id": user_id,
+        "details": details
+    }
+
+def enqueue_audit(
+    action: str,
+    entity_type: str,
+    entity_id: int,
+    user_id: Optional[int] = None,
+    details: Optional[Dict[str, Any]] = None
+) -> None:
+    """Queue a routine audit entry for the background batch writer."""
+    entry = _entry(action, entity_type, entity_id, user_id, details)
+    if _audit_queue is None:
+        _pending.append(entry)
+    else:
+        _audit_queue.put_nowait(entry)
+
+async def write_audit(
+    db: AsyncSession,
+    action: str,
+    entity_type: str,
+    entity_id: int,
+    user_id: Optional[int] = None,
+    details: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Write a security-critical audit entry as part of the caller's transaction.
+
+    Unlike enqueue_audit, the entry is committed or rolled back together
+    with the request's own changes.
+    """
+    await db.execute(insert(AuditLog), [_entry(action, entity_type, entity_id, user_id, details)])
+
+async def _flush(batch: List[Dict[str, Any]]) -> None:
+    """Insert a batch of audit entries as a single executemany."""
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(AuditLog), batch)
+            await session.commit()
+    except Exception:
+        logger.exception("Failed to write %d audit log entries", len(batch))
+
+async def _collect_batch(queue: "asyncio.Queue[Optional[Dict[str, Any]]]") -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Wait for one entry, then gather more until the batch is full or the window closes.
+
+    Returns the batch and whether the stop sentinel was reached.
+    """
+    batch: List[Dict[str, Any]] = []
+    entry = await queue.get()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _BATCH_WINDOW
+    while entry is not None:
+        batch.append(entry)
+        timeout = deadline - loop.time()
+        if len(batch) >= _BATCH_SIZE or timeout <= 0:
+            break
+        try:
+            entry = await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            break
+    return batch, entry is None
+
+async def _audit_writer(queue: "asyncio.Queue[Optional[Dict[str, Any]]]") -> None:
+    stopping = False
+    while not stopping:
+        batch, stopping = await _collect_batch(queue)
+        if batch:
+            await _flush(batch)
+
+def start_audit_writer() -> None:
+    """Create the audit queue on the running loop and start the task that drains it."""
+    global _audit_queue, _writer_task
+    if _writer_task is not None and not _writer_task.done():
+        return
+
+    _audit_queue = asyncio.Queue()
+    for entry in _pending:
+        _audit_queue.put_nowait(entry)
+    _pending.clear()
+    _writer_task = asyncio.create_task(_audit_writer(_audit_queue))
+
+async def stop_audit_writer() -> None:
+    """Stop the background writer, flush anything still queued and drop the queue."""
+    global _audit_queue, _writer_task
+    queue = _audit_queue
+    if queue is None:
+        return
+
+    if _writer_task is not None:
+        # A sentinel rather than cancel() so the in-flight batch is written
+        queue.put_nowait(None)
+        await _writer_task
+        _writer_task = None
+
+    # Later entries go to the pending buffer while the leftovers are flushed
+    _audit_queue = None
+    batch: List[Dict[str, Any]] = []
+    while not queue.empty():
+        entry = queue.get_nowait()
+        if entry is not None:
+            batch.append(entry)
+    if batch:
+        await _flush(batch)
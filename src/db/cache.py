@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from ..config.settings import get_settings
+from .models import User
+
+settings = get_settings()
+
+class TTLCache:
+    """Bounded in-process cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop a cached value if present."""
+        self._entries.pop(key, None)
+
+# Columns needed to authorize a request; the password hash is never cached
+_USER_CACHE_COLUMNS = (
+    "id", "username", "email", "is_active", "is_superuser", "created_at", "updated_at"
+)
+
+user_cache = TTLCache(ttl=settings.USER_CACHE_TTL)
+
+async def fetch_user(db: AsyncSession, username: str) -> Optional[User]:
+    """
+    Get a user by username for request authentication, served from cache when possible.
+
+    Cache hits return a detached User built from the cached columns, so it
+    must only be read, never added to a session.
+    """
+    cached: Optional[Dict[str, Any]] = user_cache.get(username)
+    if cached is not None:
+        return User(**cached)
+
+    result = await db.execute(select(User).filter(User.username == username))
+    user = result.scalar_one_or_none()
+    if user is not None:
+        user_cache.set(username, {column: getattr(user, column) for column in _USER_CACHE_COLUMNS})
+    return user
+
+def _flags_key(username: str) -> Tuple[str, str]:
+    return ("flags", username)
+
+async def fetch_user_flags(db: AsyncSession, username: str) -> Optional[Tuple[int, bool, bool]]:
+    """
+    Get a user's (id, is_superuser, is_active) by username, served from cache when possible.
+
+    A cached full user entry is reused; otherwise only these three columns
+    are selected and cached under their own key.
+    """
+    cached: Optional[Dict[str, Any]] = user_cache.get(username)
+    if cached is not None:
+        return cached["id"], cached["is_superuser"], cached["is_active"]
+
+    flags: Optional[Tuple[int, bool, bool]] = user_cache.get(_flags_key(username))
+    if flags is not None:
+        return flags
+
+    result = await db.execute(
+        select(User.id, User.is_superuser, User.is_active)
+        .filter(User.username == username)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    flags = tuple(row)
+    user_cache.set(_flags_key(username), flags)
+    return flags
+
+def invalidate_user(username: str) -> None:
+    """Forget the cached entries for a user after it changes."""
+    user_cache.pop(username)
+    user_cache.pop(_flags_key(username))
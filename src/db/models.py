@@ -1,12 +1,16 @@
 from datetime import datetime
 from typing import Any
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Boolean, ForeignKey, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.ext.declarative import declared_attr
 
 from .session import Base
 
+# Binary JSONB on PostgreSQL, plain JSON elsewhere (e.g. SQLite)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 class TimestampMixin:
     """Mixin for adding created_at and updated_at timestamps."""
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -24,9 +28,9 @@ class BaseModel(Base):
 
 class User(TimestampMixin, BaseModel):
     """User model for authentication and tracking."""
-    username = Column(String, unique=True, index=True, nullable=False)
-    email = Column(String, unique=True, index=True, nullable=False)
-    hashed_password = Column(String, nullable=False)
+    username = Column(String(64), unique=True, index=True, nullable=False)
+    email = Column(String(320), unique=True, index=True, nullable=False)
+    hashed_password = Column(String(60), nullable=False)  # bcrypt hashes are always 60 chars
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     
@@ -36,46 +40,83 @@ class User(TimestampMixin, BaseModel):
 
 class Certificate(TimestampMixin, BaseModel):
     """Certificate management model."""
-    name = Column(String, nullable=False)
-    cert_type = Column(String, nullable=False)  # client, server, ca
+    name = Column(String(255), nullable=False)
+    cert_type = Column(String(16), nullable=False)  # client, server, ca
     file_path = Column(String, nullable=False)
     expiration_date = Column(DateTime(timezone=True), nullable=False)
     is_revoked = Column(Boolean, default=False)
     revocation_date = Column(DateTime(timezone=True), nullable=True)
     
     # Foreign Keys
-    user_id = Column(Integer, ForeignKey("user.id"))
+    user_id = Column(Integer, ForeignKey("user.id"), index=True)
     
     # Relationships
     user = relationship("User", back_populates="certificates")
     data_packages = relationship("DataPackage", back_populates="certificate")
 
+    __table_args__ = (
+        Index("ix_cert_expiry_active", "expiration_date", "is_revoked"),
+    )
+
+    @property
+    def user_username(self) -> str:
+        """Username of the owning user (requires `user` to be loaded)."""
+        return self.user.username
+
+    @property
+    def user_email(self) -> str:
+        """Email of the owning user (requires `user` to be loaded)."""
+        return self.user.email
+
 class DataPackage(TimestampMixin, BaseModel):
     """Data package model for managing ATAK configurations."""
-    name = Column(String, nullable=False)
-    package_type = Column(String, nullable=False)  # full, basic, itak
+    name = Column(String(255), nullable=False)
+    package_type = Column(String(16), nullable=False)  # full, basic, itak
     file_path = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
     
     # Configuration fields
-    server_config = Column(String, nullable=False)  # JSON string of server configuration
-    manifest_config = Column(String, nullable=False)  # JSON string of manifest configuration
+    server_config = Column(JSONType, nullable=False)
+    manifest_config = Column(JSONType, nullable=False)
     
     # Foreign Keys
-    user_id = Column(Integer, ForeignKey("user.id"))
-    certificate_id = Column(Integer, ForeignKey("certificate.id"))
+    user_id = Column(Integer, ForeignKey("user.id"), index=True)
+    certificate_id = Column(Integer, ForeignKey("certificate.id"), index=True)
     
     # Relationships
-    user = relationship("User", back_populates="data_packages")
-    certificate = relationship("Certificate", back_populates="data_packages")
+    user = relationship("User", back_populates="data_packages", lazy="selectin")
+    certificate = relationship("Certificate", back_populates="data_packages", lazy="selectin")
+
+    @property
+    def user_username(self) -> str:
+        """Username of the owning user (requires `user` to be loaded)."""
+        return self.user.username
+
+    @property
+    def certificate_name(self) -> str:
+        """Name of the associated certificate (requires `certificate` to be loaded)."""
+        return self.certificate.name
+
+    @property
+    def certificate_type(self) -> str:
+        """Type of the associated certificate (requires `certificate` to be loaded)."""
+        return self.certificate.cert_type
 
 class AuditLog(TimestampMixin, BaseModel):
     """Audit log for tracking system activities."""
-    action = Column(String, nullable=False)
-    entity_type = Column(String, nullable=False)
+    # 64-bit ids for the highest-volume table; SQLite only auto-increments INTEGER keys
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, index=True)
+    action = Column(String(32), nullable=False)
+    entity_type = Column(String(32), nullable=False)
     entity_id = Column(Integer, nullable=False)
     user_id = Column(Integer, ForeignKey("user.id"))
-    details = Column(String, nullable=True)  # JSON string of additional details
+    details = Column(JSONType, nullable=True)  # Additional details
     
     # Relationships
     user = relationship("User")
+
+    __table_args__ = (
+        Index("ix_auditlog_user_created", "user_id", "created_at"),
+        Index("ix_auditlog_entity", "entity_type", "entity_id"),
+        Index("ix_auditlog_details_gin", "details", postgresql_using="gin"),
+    )
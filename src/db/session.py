@@ -1,7 +1,10 @@
+import asyncio
 from typing import AsyncGenerator, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from redis import Redis
+from redis.asyncio import ConnectionPool, Redis as AsyncRedis
 from sqlalchemy.ext.declarative import declarative_base
 
 from config.settings import get_settings
@@ -9,12 +12,39 @@ from config.settings import get_settings
 settings = get_settings()
 
 # SQLAlchemy setup
-engine = create_async_engine(
+database_url = make_url(
     settings.ASYNC_DATABASE_URL or settings.DATABASE_URL.replace(
         "postgresql://", "postgresql+asyncpg://"
-    ),
-    echo=settings.is_development,
-    future=True
+    )
+)
+
+# Statement caches for the asyncpg driver (SQLAlchemy adapter and asyncpg itself)
+connect_args = {}
+if database_url.get_driver_name() == "asyncpg":
+    connect_args = {
+        "prepared_statement_cache_size": 500,
+        "statement_cache_size": 500
+    }
+
+# Queue pool sizing; SQLite's aiosqlite dialect uses NullPool, which rejects these
+pool_args = {}
+if database_url.get_backend_name() != "sqlite":
+    pool_args = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True
+    }
+
+engine = create_async_engine(
+    database_url,
+    echo=False,
+    echo_pool="debug" if settings.is_development else False,
+    future=True,
+    query_cache_size=1200,
+    connect_args=connect_args,
+    **pool_args
 )
 
 AsyncSessionLocal = sessionmaker(
@@ -26,18 +56,38 @@ AsyncSessionLocal = sessionmaker(
 Base = declarative_base()
 
 # Redis setup
-redis_client: Optional[Redis] = None
+redis_pool: Optional[ConnectionPool] = None
+redis_client: Optional[AsyncRedis] = None
 if settings.REDIS_ENABLED and settings.REDIS_URL:
-    redis_client = Redis.from_url(
+    redis_pool = ConnectionPool.from_url(
         settings.REDIS_URL,
+        max_connections=20,
         decode_responses=True
     )
+    redis_client = AsyncRedis(connection_pool=redis_pool)
 
 async def init_db() -> None:
     """Initialize database and create all tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+async def _ping() -> None:
+    """Check out a connection and run a trivial query on it."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+async def warm_db_pool() -> None:
+    """Open the pool's connections up front so early requests skip connect and auth."""
+    await asyncio.gather(*(_ping() for _ in range(settings.DB_POOL_SIZE)))
+
+async def close_connections() -> None:
+    """Dispose of the database pool and close Redis connections."""
+    await engine.dispose()
+    if redis_client is not None:
+        await redis_client.aclose()
+    if redis_pool is not None:
+        await redis_pool.aclose()
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions."""
     async with AsyncSessionLocal() as session:
@@ -50,28 +100,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
-def get_redis() -> Optional[Redis]:
+def get_redis() -> Optional[AsyncRedis]:
     """Get Redis client if enabled."""
     return redis_client
 
 # Database health check
-async def check_db_health() -> bool:
+async def check_db_health(timeout: float = 2.0) -> bool:
     """Check database connection health."""
     try:
-        async with AsyncSessionLocal() as session:
-            await session.execute("SELECT 1")
+        await asyncio.wait_for(_ping(), timeout=timeout)
         return True
     except Exception:
         return False
 
 # Redis health check
-def check_redis_health() -> bool:
+async def check_redis_health() -> bool:
     """Check Redis connection health if enabled."""
     if not settings.REDIS_ENABLED:
         return True
     try:
         if redis_client:
-            redis_client.ping()
+            await redis_client.ping()
         return True
     except Exception:
         return False
@@ -1,10 +1,41 @@
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
 
 from config.settings import get_settings, Settings
-from db.session import init_db
+from db.session import init_db, warm_db_pool, close_connections, get_redis
+from db.audit import start_audit_writer, stop_audit_writer
 from api.router import api_router
+from utils.certificate import ensure_certificate_dirs
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and release them on shutdown."""
+    await init_db()
+    await warm_db_pool()
+    ensure_certificate_dirs()
+
+    # Response cache: Redis when enabled, otherwise per-process memory
+    redis = get_redis()
+    if redis is not None:
+        backend = RedisBackend(redis)
+    else:
+        backend = InMemoryBackend()
+    FastAPICache.init(backend, prefix="atak-cache")
+
+    start_audit_writer()
+
+    yield
+
+    # Flush pending work before the connections go away
+    await stop_audit_writer()
+    await close_connections()
 
 def create_application() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -13,7 +44,9 @@ def create_application() -> FastAPI:
     app = FastAPI(
         title=settings.APP_NAME,
         version=settings.VERSION,
-        debug=settings.DEBUG
+        debug=settings.DEBUG,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
 
     # Configure CORS
@@ -28,12 +61,8 @@ def create_application() -> FastAPI:
     # Include API routes
     app.include_router(api_router, prefix="/api")
 
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize services on application startup."""
-        await init_db()
-
     @app.get("/health")
+    @cache(expire=5)
     async def health_check(settings: Settings = Depends(get_settings)):
         """Health check endpoint."""
         return {
@@ -52,5 +81,7 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.is_development
+        reload=settings.is_development,
+        loop="uvloop",
+        http="httptools"
     )
@@ -3,6 +3,7 @@ import asyncio
 import os
 import sys
 from pathlib import Path
+from sqlalchemy.future import select
 
 # Add src directory to Python path
 src_path = str(Path(__file__).parent.parent)
@@ -17,7 +18,7 @@ async def create_superuser():
     async with AsyncSessionLocal() as session:
         # Check if superuser already exists
         result = await session.execute(
-            "SELECT id FROM users WHERE is_superuser = true LIMIT 1"
+            select(User.id).filter(User.is_superuser.is_(True)).limit(1)
         )
         if result.scalar_one_or_none():
             print("Superuser already exists")
@@ -1,14 +1,30 @@
 import os
 import subprocess
 import asyncio
+import secrets
+import time
+from pathlib import Path
 from typing import Dict
-from datetime import datetime
+from datetime import datetime, timezone
+
+from cryptography import x509
+from cryptography.hazmat.primitives.serialization import pkcs12
 
 from ..config.settings import get_settings
 from ..db.models import User
 
 settings = get_settings()
 
+_MAKE_ROOT_CA = os.path.join(settings.ATAK_CERT_DIR, "makeRootCa.sh")
+_MAKE_CERT = os.path.join(settings.ATAK_CERT_DIR, "makeCert.sh")
+_REVOKE_CERT = os.path.join(settings.ATAK_CERT_DIR, "revokeCert.sh")
+_CA_PEM = os.path.join(settings.ATAK_CERT_DIR, "ca.pem")
+
+def ensure_certificate_dirs() -> None:
+    """Create the certificate directories if they do not exist yet."""
+    os.makedirs(settings.ATAK_CERT_DIR, exist_ok=True)
+    os.makedirs(settings.ATAK_FILES_DIR, exist_ok=True)
+
 async def generate_certificate(cert_type: str, name: str, user: User) -> Dict[str, str]:
     """
     Generate a new certificate using ATAK's certificate generation tools.
@@ -21,33 +37,29 @@ async def generate_certificate(cert_type: str, name: str, user: User) -> Dict[st
     Returns:
         Dict containing certificate information including file paths
     """
-    # Ensure certificate directories exist
-    os.makedirs(settings.ATAK_CERT_DIR, exist_ok=True)
-    os.makedirs(settings.ATAK_FILES_DIR, exist_ok=True)
-
     # Generate safe certificate name
-    safe_name = f"{name}_{user.username}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+    safe_name = f"{name}_{user.username}_{int(time.time())}_{secrets.token_hex(4)}"
     
     try:
         if cert_type == "ca":
             # Generate CA certificate
             process = await asyncio.create_subprocess_exec(
-                os.path.join(settings.ATAK_CERT_DIR, "makeRootCa.sh"),
+                _MAKE_ROOT_CA,
                 "--ca-name", safe_name,
-                stdout=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE
             )
         else:
             # Generate client or server certificate
             process = await asyncio.create_subprocess_exec(
-                os.path.join(settings.ATAK_CERT_DIR, "makeCert.sh"),
+                _MAKE_CERT,
                 cert_type,
                 safe_name,
-                stdout=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE
             )
 
-        stdout, stderr = await process.communicate()
+        _, stderr = await process.communicate()
         
         if process.returncode != 0:
             raise Exception(f"Certificate generation failed: {stderr.decode()}")
@@ -65,17 +77,29 @@ async def generate_certificate(cert_type: str, name: str, user: User) -> Dict[st
 
     except Exception as e:
         # Clean up any partially generated files
-        cleanup_paths = [
-            os.path.join(settings.ATAK_FILES_DIR, f"{safe_name}.p12"),
-            os.path.join(settings.ATAK_FILES_DIR, f"{safe_name}.pem"),
-            os.path.join(settings.ATAK_FILES_DIR, f"{safe_name}.key")
-        ]
-        for path in cleanup_paths:
-            if os.path.exists(path):
-                os.remove(path)
+        await asyncio.to_thread(_remove_partial_files, safe_name)
         
         raise Exception(f"Failed to generate certificate: {str(e)}")
 
+def _remove_partial_files(safe_name: str) -> None:
+    """Delete whatever files a failed generation run left behind."""
+    for ext in (".p12", ".pem", ".key"):
+        Path(settings.ATAK_FILES_DIR, f"{safe_name}{ext}").unlink(missing_ok=True)
+
+def _load_certificate(cert_path: str) -> x509.Certificate:
+    """Read and parse a PKCS#12, PEM or DER certificate file."""
+    data = Path(cert_path).read_bytes()
+    if cert_path.endswith(".p12"):
+        _, cert, _ = pkcs12.load_key_and_certificates(
+            data, settings.ATAK_CERT_PASSWORD.encode()
+        )
+        if cert is None:
+            raise ValueError("PKCS#12 bundle contains no certificate")
+        return cert
+    if data.lstrip().startswith(b"-----BEGIN"):
+        return x509.load_pem_x509_certificate(data)
+    return x509.load_der_x509_certificate(data)
+
 async def revoke_certificate(cert_path: str) -> None:
     """
     Revoke a certificate using ATAK's certificate revocation tools.
@@ -88,30 +112,19 @@ async def revoke_certificate(cert_path: str) -> None:
 
     try:
         # Get certificate serial number
-        process = await asyncio.create_subprocess_exec(
-            "openssl",
-            "pkcs12",
-            "-in", cert_path,
-            "-nokeys",
-            "-serial",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
-        
-        if process.returncode != 0:
-            raise Exception(f"Failed to get certificate serial: {stderr.decode()}")
-
-        serial = stdout.decode().split("=")[1].strip()
+        cert = await asyncio.to_thread(_load_certificate, cert_path)
+        # openssl prints whole bytes, so pad odd-length hex with a leading zero
+        serial = format(cert.serial_number, "X")
+        serial = serial.zfill(len(serial) + len(serial) % 2)
 
         # Revoke certificate
         process = await asyncio.create_subprocess_exec(
-            os.path.join(settings.ATAK_CERT_DIR, "revokeCert.sh"),
+            _REVOKE_CERT,
             serial,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE
         )
-        stdout, stderr = await process.communicate()
+        _, stderr = await process.communicate()
         
         if process.returncode != 0:
             raise Exception(f"Certificate revocation failed: {stderr.decode()}")
@@ -134,17 +147,12 @@ async def verify_certificate(cert_path: str) -> bool:
 
     try:
         # Verify certificate against CA
-        process = await asyncio.create_subprocess_exec(
-            "openssl",
-            "verify",
-            "-CAfile", os.path.join(settings.ATAK_CERT_DIR, "ca.pem"),
-            cert_path,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
-        
-        return process.returncode == 0
+        cert = await asyncio.to_thread(_load_certificate, cert_path)
+        ca_cert = await asyncio.to_thread(_load_certificate, _CA_PEM)
+        cert.verify_directly_issued_by(ca_cert)
+
+        now = datetime.now(timezone.utc)
+        return cert.not_valid_before_utc <= now <= cert.not_valid_after_utc
 
     except Exception:
         return False
@@ -163,29 +171,13 @@ async def get_certificate_info(cert_path: str) -> Dict[str, str]:
         raise Exception("Certificate file not found")
 
     try:
-        # Get certificate information
-        process = await asyncio.create_subprocess_exec(
-            "openssl",
-            "x509",
-            "-in", cert_path,
-            "-text",
-            "-noout",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
-        
-        if process.returncode != 0:
-            raise Exception(f"Failed to get certificate info: {stderr.decode()}")
+        cert = await asyncio.to_thread(_load_certificate, cert_path)
 
-        info = stdout.decode()
-        
-        # Parse relevant information
         return {
-            "subject": next((line.strip() for line in info.split('\n') if "Subject:" in line), ""),
-            "issuer": next((line.strip() for line in info.split('\n') if "Issuer:" in line), ""),
-            "validity": next((line.strip() for line in info.split('\n') if "Not After" in line), ""),
-            "serial": next((line.strip() for line in info.split('\n') if "Serial Number:" in line), "")
+            "subject": cert.subject.rfc4514_string(),
+            "issuer": cert.issuer.rfc4514_string(),
+            "validity": cert.not_valid_after_utc.isoformat(),
+            "serial": hex(cert.serial_number)
         }
 
     except Exception as e:
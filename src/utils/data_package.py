@@ -1,15 +1,53 @@
 import os
+import re
 import json
 import shutil
 import uuid
-from typing import Dict
-from datetime import datetime
+import asyncio
+import secrets
+import time
+import zipfile
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import aiofiles
+import aiofiles.os
 
 from ..config.settings import get_settings
 from ..db.models import User, Certificate, DataPackage
 
 settings = get_settings()
 
+_PLACEHOLDER_RE = re.compile(r"##(\w+)##")
+
+_TEMPLATE_BASIC = os.path.join(settings.ATAK_CERT_DIR, "template")
+_TEMPLATE_FULL = os.path.join(settings.ATAK_CERT_DIR, "template-full")
+
+# Level 1 deflate: near level-6 size on small text files for a fraction of the CPU
+_ZIP_COMPRESSLEVEL = 1
+_STORED_SUFFIXES = ('.p12', '.png', '.jpg')
+
+# Files rendered from the cached template text rather than copied
+_PREF_FILE = "secure.pref"
+_MANIFEST_FILE = os.path.join("MANIFEST", "manifest.xml")
+
+def _template_path(package_type: str) -> str:
+    """Return the template directory used for a package type."""
+    return _TEMPLATE_FULL if package_type == "full" else _TEMPLATE_BASIC
+
+@lru_cache(maxsize=4)
+def _get_template(template_path: str, filename: str) -> Optional[str]:
+    """
+    Read a template file once per process.
+
+    Returns None when the template has no such file. Changes to the
+    template directory take effect after a restart.
+    """
+    try:
+        with open(os.path.join(template_path, filename), 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
 async def create_data_package_files(
     package_type: str,
     server_config: Dict,
@@ -31,29 +69,23 @@ async def create_data_package_files(
         str: Path to the created data package
     """
     # Create unique package directory
-    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-    package_dir = f"data_package_{user.username}_{timestamp}"
+    package_dir = f"data_package_{user.username}_{int(time.time())}_{secrets.token_hex(4)}"
     package_path = os.path.join(settings.ATAK_FILES_DIR, package_dir)
-    os.makedirs(package_path, exist_ok=True)
+    await asyncio.to_thread(os.makedirs, package_path, exist_ok=True)
 
     try:
         # Copy appropriate template based on package type
-        template_dir = "template-full" if package_type == "full" else "template"
-        template_path = os.path.join(settings.ATAK_CERT_DIR, template_dir)
-        
-        for item in os.listdir(template_path):
-            source = os.path.join(template_path, item)
-            destination = os.path.join(package_path, item)
-            
-            if os.path.isdir(source):
-                shutil.copytree(source, destination)
-            else:
-                shutil.copy2(source, destination)
+        copies = await _template_copies(_template_path(package_type), package_path)
 
         # Copy certificate file if full package
         if package_type == "full":
             cert_destination = os.path.join(package_path, os.path.basename(certificate.file_path))
-            shutil.copy2(certificate.file_path, cert_destination)
+            copies.append((certificate.file_path, cert_destination))
+
+        # Each top-level item is copied concurrently in the default thread pool
+        await asyncio.gather(
+            *(asyncio.to_thread(_copy_item, source, destination) for source, destination in copies)
+        )
 
         # Update configuration files
         await update_package_configs(
@@ -65,31 +97,96 @@ async def create_data_package_files(
         )
 
         # Create zip file
-        zip_path = f"{package_path}.zip"
         if package_type == "itak":
             # iTAK specific packaging
-            suffix = '_iTAK'
-            os.chdir(package_path)
-            os.rename('secure.pref', 'config.pref')
-            shutil.make_archive(f"{package_path}{suffix}", 'zip', package_path, 
-                              base_dir=None, 
-                              include_files=['config.pref', '*.p12'])
-            zip_path = f"{package_path}{suffix}.zip"
+            zip_path = f"{package_path}_iTAK.zip"
+            await asyncio.to_thread(_make_itak_archive, package_path, zip_path)
         else:
             # Standard packaging
-            shutil.make_archive(package_path, 'zip', package_path)
+            zip_path = f"{package_path}.zip"
+            await asyncio.to_thread(_make_archive, package_path, zip_path)
 
         # Cleanup temporary directory
-        shutil.rmtree(package_path)
+        await asyncio.to_thread(shutil.rmtree, package_path)
         
         return zip_path
 
     except Exception as e:
         # Cleanup on failure
-        if os.path.exists(package_path):
-            shutil.rmtree(package_path)
+        await asyncio.to_thread(shutil.rmtree, package_path, ignore_errors=True)
         raise Exception(f"Failed to create data package: {str(e)}")
 
+async def _template_copies(template_path: str, package_path: str) -> List[Tuple[str, str]]:
+    """
+    List the (source, destination) pairs needed to copy a template into a package.
+
+    The preference file is left out; update_package_configs renders it.
+
+    Args:
+        template_path: Path to the template directory
+        package_path: Path to the data package directory
+    """
+    items = await asyncio.to_thread(os.listdir, template_path)
+    return [
+        (os.path.join(template_path, item), os.path.join(package_path, item))
+        for item in items
+        if item != _PREF_FILE
+    ]
+
+def _skip_manifest(directory: str, names: List[str]) -> List[str]:
+    """copytree ignore hook that leaves out the rendered manifest."""
+    if os.path.basename(directory) != os.path.dirname(_MANIFEST_FILE):
+        return []
+    return [name for name in names if name == os.path.basename(_MANIFEST_FILE)]
+
+def _copy_item(source: str, destination: str) -> None:
+    """Copy a file or a whole directory tree."""
+    if os.path.isdir(source):
+        shutil.copytree(source, destination, ignore=_skip_manifest)
+    else:
+        shutil.copy2(source, destination)
+
+def _compress_type(filename: str) -> int:
+    """Store already-compressed files as-is and deflate everything else."""
+    return zipfile.ZIP_STORED if filename.endswith(_STORED_SUFFIXES) else zipfile.ZIP_DEFLATED
+
+def _make_archive(package_path: str, zip_path: str) -> None:
+    """
+    Zip the whole data package directory.
+
+    Args:
+        package_path: Path to the data package directory
+        zip_path: Path of the zip file to create
+    """
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL) as zf:
+        for root, _, files in os.walk(package_path):
+            for filename in sorted(files):
+                source = os.path.join(root, filename)
+                arcname = os.path.relpath(source, package_path)
+                zf.write(source, arcname, compress_type=_compress_type(filename))
+
+def _make_itak_archive(package_path: str, zip_path: str) -> None:
+    """
+    Write an iTAK data package, which holds only config.pref and the .p12 files.
+
+    Args:
+        package_path: Path to the data package directory
+        zip_path: Path of the zip file to create
+    """
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL) as zf:
+        items = sorted(os.listdir(package_path))
+        for item in items:
+            source = os.path.join(package_path, item)
+            if item == _PREF_FILE:
+                # iTAK expects the preference file under this name
+                zf.write(source, 'config.pref')
+            elif item == 'config.pref':
+                # On update the extracted config.pref is superseded by the rendered one
+                if _PREF_FILE not in items:
+                    zf.write(source, item)
+            elif item.endswith('.p12'):
+                zf.write(source, item, compress_type=zipfile.ZIP_STORED)
+
 async def update_package_configs(
     package_path: str,
     package_type: str,
@@ -98,7 +195,7 @@ async def update_package_configs(
     certificate: Certificate
 ) -> None:
     """
-    Update configuration files in a data package.
+    Write a data package's configuration files from its cached template.
     
     Args:
         package_path: Path to the data package directory
@@ -107,35 +204,44 @@ async def update_package_configs(
         manifest_config: Manifest configuration
         certificate: Associated certificate
     """
-    # Update preference file
-    pref_file = os.path.join(package_path, 'secure.pref')
-    if os.path.exists(pref_file):
-        with open(pref_file, 'r') as f:
-            content = f.read()
+    template_path = _template_path(package_type)
 
-        # Replace configuration placeholders
-        content = content.replace('##hostname##', f"{server_config['hostname']}:{server_config['port']}")
-        content = content.replace('##protocol##', server_config['protocol'])
-        
+    # Render preference file
+    pref_template = _get_template(template_path, _PREF_FILE)
+    if pref_template is not None:
+        pref_values = {
+            'hostname': f"{server_config['hostname']}:{server_config['port']}",
+            'protocol': server_config['protocol']
+        }
         if package_type == "full":
-            content = content.replace('##caLocation##', os.path.basename(certificate.file_path))
+            pref_values['caLocation'] = os.path.basename(certificate.file_path)
 
-        with open(pref_file, 'w') as f:
-            f.write(content)
+        await _write_rendered(os.path.join(package_path, _PREF_FILE), pref_template, pref_values)
 
-    # Update manifest file
-    manifest_file = os.path.join(package_path, 'MANIFEST', 'manifest.xml')
-    if os.path.exists(manifest_file):
-        with open(manifest_file, 'r') as f:
-            content = f.read()
+    # Render manifest file
+    manifest_template = _get_template(template_path, _MANIFEST_FILE)
+    if manifest_template is not None:
+        manifest_values = {key: str(value) for key, value in manifest_config.items()}
+        manifest_values['uuid'] = str(uuid.uuid4())
 
-        # Replace manifest placeholders
-        content = content.replace('##uuid##', str(uuid.uuid4()))
-        for key, value in manifest_config.items():
-            content = content.replace(f'##{key}##', str(value))
+        manifest_file = os.path.join(package_path, _MANIFEST_FILE)
+        await aiofiles.os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+        await _write_rendered(manifest_file, manifest_template, manifest_values)
+
+async def _write_rendered(file_path: str, template: str, values: Dict[str, str]) -> None:
+    """
+    Replace every ##key## placeholder in a template in a single pass and write the result.
+
+    Args:
+        file_path: Destination file, created or overwritten
+        template: Template text
+        values: Replacement text keyed by placeholder name; unknown
+            placeholders are left untouched
+    """
+    content = _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
 
-        with open(manifest_file, 'w') as f:
-            f.write(content)
+    async with aiofiles.open(file_path, 'w') as f:
+        await f.write(content)
 
 async def update_data_package_files(
     package: DataPackage,
@@ -152,11 +258,11 @@ async def update_data_package_files(
     """
     # Extract existing package
     package_dir = package.file_path.replace('.zip', '')
-    os.makedirs(package_dir, exist_ok=True)
+    await asyncio.to_thread(os.makedirs, package_dir, exist_ok=True)
     
     try:
         # Extract existing package
-        shutil.unpack_archive(package.file_path, package_dir, 'zip')
+        await asyncio.to_thread(shutil.unpack_archive, package.file_path, package_dir, 'zip')
 
         # Update configurations
         await update_package_configs(
@@ -167,24 +273,18 @@ async def update_data_package_files(
             certificate=package.certificate
         )
 
-        # Repackage
+        # Repackage in place of the existing archive
         if package.package_type == "itak":
-            suffix = '_iTAK'
-            os.chdir(package_dir)
-            os.rename('secure.pref', 'config.pref')
-            shutil.make_archive(f"{package_dir}{suffix}", 'zip', package_dir,
-                              base_dir=None,
-                              include_files=['config.pref', '*.p12'])
+            await asyncio.to_thread(_make_itak_archive, package_dir, package.file_path)
         else:
-            shutil.make_archive(package_dir, 'zip', package_dir)
+            await asyncio.to_thread(_make_archive, package_dir, package.file_path)
 
         # Cleanup
-        shutil.rmtree(package_dir)
+        await asyncio.to_thread(shutil.rmtree, package_dir)
 
     except Exception as e:
         # Cleanup on failure
-        if os.path.exists(package_dir):
-            shutil.rmtree(package_dir)
+        await asyncio.to_thread(shutil.rmtree, package_dir, ignore_errors=True)
         raise Exception(f"Failed to update data package: {str(e)}")
 
 def validate_package_structure(package_path: str) -> bool: